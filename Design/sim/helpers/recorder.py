@@ -5,17 +5,26 @@
 # Description: Logs signal values on every simulation cycle for debugging.
 #              Supports structured output to list-of-dictionaries format.
 #              Used by all decoder testbenches in benchmarking mode.
+#              Per-cycle cost is bound by GPI reads and row allocation, not
+#              compute: rows hold raw ints and formatting/IO happen after the
+#              run, in batches.
 # Author: RZ
 # Start Date: 20250506
-# Version: 0.2
+# Version: 0.3
 #
 # Changelog
 # ============================================================
 # [20250506-1] RZ: Implemented signal recorder for full-cycle logging.
 # [20250507-1] RZ: Updated for parser testbench.
+# [20261015-1] agent: Per-cycle cost rework: signal handles resolved once into a
+#                     generated row builder, raw ints in a preallocated log,
+#                     hex formatting and batched CSV output (to_csv()) after
+#                     the run, local cycle counter; opt-in GPI fast reads.
 # ============================================================
 
 
+import csv
+
 import cocotb
 from cocotb.triggers import RisingEdge
 from cocotb.utils import get_sim_time
@@ -23,93 +32,185 @@ from cocotb.utils import get_sim_time
 from sim_config import SIM_CLK_PERIOD_NS
 from ITCH_config import SIM_HEADERS
 
-_recorded_log = {}  # Global dictionary to store cycle-indexed logs
+BUFFER_ROWS = 4096  # Rows formatted and written per writerows() call in to_csv()
+
+_recorded_log = []  # Global list of row lists of raw ints (SIM_HEADERS order), one per recorded cycle
+_row_formats = ()   # Per-column output formatter for the current log (None = as recorded)
+
+
+# Column -> (DUT signal, logged as hex, default if the signal is not present).
+# A default of None marks a required signal: the valid flags must exist on
+# the DUT, and a missing one fails at record start rather than logging 0s.
+_SIGNALS = {
+    "add_internal_valid":           ("add_internal_valid",          False,   None),
+    "cancel_internal_valid":        ("cancel_internal_valid",       False,   None),
+    "delete_internal_valid":        ("delete_internal_valid",       False,   None),
+    "replace_internal_valid":       ("replace_internal_valid",      False,   None),
+    "executed_internal_valid":      ("exec_internal_valid",         False,   None),
+    "trade_internal_valid":         ("trade_internal_valid",        False,   None),
+    "add_mpid_internal_valid":      ("add_mpid_internal_valid",     False,   None),
+    "broken_internal_valid":        ("broken_internal_valid",       False,   None),
+    "exec_price_internal_valid":    ("exec_price_internal_valid",   False,   None),
+
+    "add_order_ref":                ("add_order_ref",               True,    0),
+    "add_shares":                   ("add_shares",                  True,    0),
+    "add_price":                    ("add_price",                   True,    0),
+    "add_side":                     ("add_side",                    True,    ""),
+
+    "cancel_order_ref":             ("cancel_order_ref",            True,    0),
+    "cancel_shares":                ("cancel_canceled_shares",      True,    0),
+
+    "delete_order_ref":             ("delete_order_ref",            True,    0),
+
+    "replace_old_order_ref":        ("replace_old_order_ref",       True,    0),
+    "replace_new_order_ref":        ("replace_new_order_ref",       True,    0),
+    "replace_shares":               ("replace_shares",              True,    0),
+    "replace_price":                ("replace_price",               True,    0),
+
+    "exec_timestamp":               ("exec_timestamp",              True,    0),
+    "exec_order_ref":               ("exec_order_ref",              True,    0),
+    "exec_shares":                  ("exec_shares",                 True,    0),
+    "exec_match_id":                ("exec_match_id",               True,    0),
+
+    "trade_timestamp":              ("trade_timestamp",             True,    0),
+    "trade_order_ref":              ("trade_order_ref",             True,    0),
+    "trade_side":                   ("trade_side",                  True,    0),
+    "trade_shares":                 ("trade_shares",                True,    0),
+    "trade_stock_symbol":           ("trade_stock_symbol",          True,    0),
+    "trade_price":                  ("trade_price",                 True,    0),
+    "trade_match_id":               ("trade_match_id",              True,    0),
+
+    "add_mpid_order_ref":           ("add_mpid_order_ref",          True,    0),
+    "add_mpid_shares":              ("add_mpid_shares",             True,    0),
+    "add_mpid_price":               ("add_mpid_price",              True,    0),
+    "add_mpid_side":                ("add_mpid_side",               True,    ""),
+    "add_mpid_stock_symbol":        ("add_mpid_stock_symbol",       True,    0),
+    "add_mpid_attribution":         ("add_mpid_attribution",        True,    0),
+
+    "broken_timestamp":             ("broken_timestamp",            True,    0),
+    "broken_match_id":              ("broken_match_id",             True,    0),
+
+    "exec_price_timestamp":         ("exec_price_timestamp",        True,    0),
+    "exec_price_order_ref":         ("exec_price_order_ref",        True,    0),
+    "exec_price_shares":            ("exec_price_shares",           True,    0),
+    "exec_price_match_id":          ("exec_price_match_id",         True,    0),
+    "exec_price_printable":         ("exec_price_printable",        True,    0),
+    "exec_price_price":             ("exec_price_price",            True,    0),
+
+    "add_parsed_type":              ("add_parsed_type",             True,    ""),
+    "cancel_parsed_type":           ("cancel_parsed_type",          True,    ""),
+    "delete_parsed_type":           ("delete_parsed_type",          True,    ""),
+    "replace_parsed_type":          ("replace_parsed_type",         True,    ""),
+    "exec_parsed_type":             ("exec_parsed_type",            True,    ""),
+    "trade_parsed_type":            ("trade_parsed_type",           True,    ""),
+    "add_mpid_parsed_type":         ("add_mpid_parsed_type",        True,    ""),
+    "broken_parsed_type":           ("broken_parsed_type",          True,    ""),
+    "exec_price_parsed_type":       ("exec_price_parsed_type",      True,    ""),
+}
+
+# Extraction schedule in SIM_HEADERS order; column 0 ("cycle") is filled by the recorder
+_SCHEDULE = tuple(_SIGNALS[col] for col in SIM_HEADERS[1:])
+
+
+def _read_expr(name, h, ns, fast_reads):
+    """
+    Returns a source expression reading the integer value of handle h and
+    binds what it needs into ns under name. Reads go through .value, which
+    raises on X/Z bits. With fast_reads, signals up to 32 bits instead use
+    the private GPI long accessor: it skips building a BinaryValue per read,
+    but reads X/Z bits as 0, so only opt in for DUTs known to drive every
+    output.
+    """
+    get_long = getattr(getattr(h, "_handle", None), "get_signal_val_long", None)
+    width = len(h)
+    if fast_reads and get_long is not None and width <= 32:
+        ns[name] = get_long
+        return f"{name}() & {hex((1 << width) - 1)}"  # GPI returns a signed C int
+    ns[name] = h
+    return f"{name}.value.integer"
+
+def _resolve_signals(dut):
+    """
+    Resolves the schedule against dut once. Returns the handles of the
+    signals present on the DUT, keyed by schedule index. Raises
+    AttributeError if a required signal is missing.
+    """
+    handles = {}
+    for i, (attr, _, default) in enumerate(_SCHEDULE):
+        if default is None:
+            handles[i] = getattr(dut, attr)
+            continue
+        h = getattr(dut, attr, None)
+        if h is not None:
+            handles[i] = h
+    return handles
+
+def _compile_row_builder(dut, fast_reads=False):
+    """
+    Generates `_record_row(cycle) -> list` for the signals present on dut.
+    Handles are resolved once and bound into the function; absent signals are
+    baked in as their default, so a cycle costs one list build with no
+    attribute probing or branching. Also returns the per-column formatters.
+    """
+    # Start from all defaults (passed through unformatted), then fill in
+    # only the present columns
+    ns = {}
+    exprs = ["cycle"] + [repr(default) for _, _, default in _SCHEDULE]
+    formats = [None] * len(exprs)
+    for i, h in _resolve_signals(dut).items():
+        col = i + 1  # column 0 is the cycle
+        exprs[col] = _read_expr(f"_s{col}", h, ns, fast_reads)
+        formats[col] = hex if _SCHEDULE[i][1] else None
+
+    src = "def _record_row(cycle):\n    return [\n        " + ",\n        ".join(exprs) + ",\n    ]\n"
+    exec(compile(src, "<recorder>", "exec"), ns)
+    return ns["_record_row"], tuple(formats)
+
+def _format_row(row):
+    return [fmt(v) if fmt else v for fmt, v in zip(_row_formats, row)]
+
+def _recorded_rows():
+    # Slots past the last recorded cycle stay None if the test ended early
+    return (row for row in _recorded_log if row is not None)
 
 def get_recorded_log():
-    return _recorded_log
-
-async def record_all_internal_valids(dut, total_cycles=300):
-    global _recorded_log
-    _recorded_log = {}  # Reset at the start
+    """Return the recorded log as {cycle: {column: value}} with hex fields formatted."""
+    return {row[0]: dict(zip(SIM_HEADERS, _format_row(row))) for row in _recorded_rows()}
+
+def to_csv(path):
+    """Write the recorded log to a SIM_HEADERS CSV, formatting hex fields on emit."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SIM_HEADERS)
+        pending = []
+        for row in _recorded_rows():
+            pending.append(_format_row(row))
+            if len(pending) >= BUFFER_ROWS:
+                writer.writerows(pending)
+                pending.clear()
+        writer.writerows(pending)
+
+async def record_all_internal_valids(dut, total_cycles=300, fast_reads=False):
+    """
+    Record one row per cycle for total_cycles cycles. fast_reads opts in to
+    GPI reads for narrow signals (see _read_expr); X/Z then log as 0
+    instead of raising.
+    """
+    global _recorded_log, _row_formats
+    _recorded_log = [None] * total_cycles  # Reset at the start
+
+    # Resolve every signal handle once: each dut attribute access is a VPI
+    # name lookup, so probing per cycle dominated the recorder's cost.
+    record_row, _row_formats = _compile_row_builder(dut, fast_reads)
 
     await RisingEdge(dut.clk)
+    # One sim-time query up front; the loop advances exactly one clock per
+    # iteration, so the cycle count is kept locally after that
+    abs_cycle = get_sim_time('ns') // SIM_CLK_PERIOD_NS
     # dut._log.info("=== Full Signal Dump ===")
 
-    for _ in range(total_cycles):
+    for i in range(total_cycles):
         await RisingEdge(dut.clk)
-        sim_time = get_sim_time('ns')
-        abs_cycle = sim_time // SIM_CLK_PERIOD_NS
-
-        # Extract signals and default to 0 if not present
-        row = {
-
-            "cycle": abs_cycle,
-
-            "add_internal_valid":       int(dut.add_internal_valid.value),
-            "cancel_internal_valid":    int(dut.cancel_internal_valid.value),
-            "delete_internal_valid":    int(dut.delete_internal_valid.value),
-            "replace_internal_valid":   int(dut.replace_internal_valid.value),
-            "executed_internal_valid":  int(dut.exec_internal_valid.value),
-            "trade_internal_valid":     int(dut.trade_internal_valid.value),
-            "add_mpid_internal_valid":  int(dut.add_mpid_internal_valid.value),
-            "broken_internal_valid":    int(dut.broken_internal_valid.value),  # Fixed!
-            "exec_price_internal_valid": int(dut.exec_price_internal_valid.value),  # Fixed!
-
-            "add_order_ref":            hex(getattr(dut, 'add_order_ref', 0).value.integer)         if hasattr(dut, 'add_order_ref') else 0,
-            "add_shares":               hex(getattr(dut, 'add_shares', 0).value.integer)            if hasattr(dut, 'add_shares') else 0,
-            "add_side":                 hex(getattr(dut, 'add_side', 0).value.integer)              if hasattr(dut, 'add_side') else "",
-            "add_price":                hex(getattr(dut, 'add_price', 0).value.integer)             if hasattr(dut, 'add_price') else 0,
-
-            "cancel_order_ref":         hex(getattr(dut, 'cancel_order_ref', 0).value.integer)      if hasattr(dut, 'cancel_order_ref') else 0,
-            "cancel_shares":            hex(getattr(dut, 'cancel_canceled_shares', 0).value.integer)if hasattr(dut, 'cancel_canceled_shares') else 0,
-
-            "delete_order_ref":         hex(getattr(dut, 'delete_order_ref', 0).value.integer)      if hasattr(dut, 'delete_order_ref') else 0,
-            
-            "replace_old_order_ref":    hex(getattr(dut, 'replace_old_order_ref', 0).value.integer) if hasattr(dut, 'replace_old_order_ref') else 0,
-            "replace_new_order_ref":    hex(getattr(dut, 'replace_new_order_ref', 0).value.integer) if hasattr(dut, 'replace_new_order_ref') else 0,
-            "replace_shares":           hex(getattr(dut, 'replace_shares', 0).value.integer)        if hasattr(dut, 'replace_shares') else 0,
-            "replace_price":            hex(getattr(dut, 'replace_price', 0).value.integer)         if hasattr(dut, 'replace_price') else 0,
-
-            "exec_timestamp":           hex(getattr(dut, 'exec_timestamp', 0).value.integer)        if hasattr(dut, 'exec_timestamp') else 0,
-            "exec_order_ref":           hex(getattr(dut, 'exec_order_ref', 0).value.integer)        if hasattr(dut, 'exec_order_ref') else 0,
-            "exec_shares":              hex(getattr(dut, 'exec_shares', 0).value.integer)           if hasattr(dut, 'exec_shares') else 0,
-            "exec_match_id":            hex(getattr(dut, 'exec_match_id', 0).value.integer)         if hasattr(dut, 'exec_match_id') else 0,
-                
-            "trade_timestamp":          hex(getattr(dut, 'trade_timestamp', 0).value.integer)       if hasattr(dut, 'trade_timestamp') else 0,
-            "trade_order_ref":          hex(getattr(dut, 'trade_order_ref', 0).value.integer)       if hasattr(dut, 'trade_order_ref') else 0,
-            "trade_side":               hex(getattr(dut, 'trade_side', 0).value.integer)            if hasattr(dut, 'trade_side') else 0,
-            "trade_shares":             hex(getattr(dut, 'trade_shares', 0).value.integer)          if hasattr(dut, 'trade_shares') else 0,
-            "trade_stock_symbol":       hex(getattr(dut, 'trade_stock_symbol', 0).value.integer)    if hasattr(dut, 'trade_stock_symbol') else 0,
-            "trade_price":              hex(getattr(dut, 'trade_price', 0).value.integer)           if hasattr(dut, 'trade_price') else 0,
-            "trade_match_id":           hex(getattr(dut, 'trade_match_id', 0).value.integer)        if hasattr(dut, 'trade_match_id') else 0,
-
-            "add_mpid_order_ref":       hex(getattr(dut, 'add_mpid_order_ref', 0).value.integer) if hasattr(dut, 'add_mpid_order_ref') else 0,
-            "add_mpid_shares":          hex(getattr(dut, 'add_mpid_shares', 0).value.integer) if hasattr(dut, 'add_mpid_shares') else 0,
-            "add_mpid_price":           hex(getattr(dut, 'add_mpid_price', 0).value.integer) if hasattr(dut, 'add_mpid_price') else 0,
-            "add_mpid_side":            hex(getattr(dut, 'add_mpid_side', 0).value.integer) if hasattr(dut, 'add_mpid_side') else "",
-            "add_mpid_stock_symbol":    hex(getattr(dut, 'add_mpid_stock_symbol', 0).value.integer) if hasattr(dut, 'add_mpid_stock_symbol') else 0,
-            "add_mpid_attribution":     hex(getattr(dut, 'add_mpid_attribution', 0).value.integer) if hasattr(dut, 'add_mpid_attribution') else 0,
-
-            "broken_timestamp":         hex(getattr(dut, 'broken_timestamp', 0).value.integer) if hasattr(dut, 'broken_timestamp') else 0,  # Added!
-            "broken_match_id":          hex(getattr(dut, 'broken_match_id', 0).value.integer) if hasattr(dut, 'broken_match_id') else 0,  # Fixed!
-
-            "exec_price_timestamp":     hex(getattr(dut, 'exec_price_timestamp', 0).value.integer) if hasattr(dut, 'exec_price_timestamp') else 0,
-            "exec_price_order_ref":     hex(getattr(dut, 'exec_price_order_ref', 0).value.integer) if hasattr(dut, 'exec_price_order_ref') else 0,
-            "exec_price_shares":        hex(getattr(dut, 'exec_price_shares', 0).value.integer) if hasattr(dut, 'exec_price_shares') else 0,
-            "exec_price_match_id":      hex(getattr(dut, 'exec_price_match_id', 0).value.integer) if hasattr(dut, 'exec_price_match_id') else 0,
-            "exec_price_printable":     hex(getattr(dut, 'exec_price_printable', 0).value.integer) if hasattr(dut, 'exec_price_printable') else 0,
-            "exec_price_price":         hex(getattr(dut, 'exec_price_price', 0).value.integer) if hasattr(dut, 'exec_price_price') else 0,
-
-            "add_parsed_type":          hex(getattr(dut, 'add_parsed_type', 0).value.integer)       if hasattr(dut, 'add_parsed_type') else "",
-            "cancel_parsed_type":       hex(getattr(dut, 'cancel_parsed_type', 0).value.integer)    if hasattr(dut, 'cancel_parsed_type') else "",
-            "delete_parsed_type":       hex(getattr(dut, 'delete_parsed_type', 0).value.integer)    if hasattr(dut, 'delete_parsed_type') else "",
-            "replace_parsed_type":      hex(getattr(dut, 'replace_parsed_type', 0).value.integer)   if hasattr(dut, 'replace_parsed_type') else "",
-            "exec_parsed_type":         hex(getattr(dut, 'exec_parsed_type', 0).value.integer)      if hasattr(dut, 'exec_parsed_type') else "",
-            "trade_parsed_type":        hex(getattr(dut, 'trade_parsed_type', 0).value.integer)     if hasattr(dut, 'trade_parsed_type') else "",
-            "add_mpid_parsed_type":     hex(getattr(dut, 'add_mpid_parsed_type', 0).value.integer) if hasattr(dut, 'add_mpid_parsed_type') else "",
-            "broken_parsed_type":       hex(getattr(dut, 'broken_parsed_type', 0).value.integer) if hasattr(dut, 'broken_parsed_type') else "",  # Fixed!
-            "exec_price_parsed_type":   hex(getattr(dut, 'exec_price_parsed_type', 0).value.integer) if hasattr(dut, 'exec_price_parsed_type') else "",  # Fixed!
-
-        }
-
-        _recorded_log[abs_cycle] = row
\ No newline at end of file
+        abs_cycle += 1
+
+        _recorded_log[i] = record_row(abs_cycle)
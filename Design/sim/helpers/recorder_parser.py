@@ -7,11 +7,12 @@
 #              Used by all decoder testbenches in benchmarking mode.
 # Author: RZ
 # Start Date: 20250507
-# Version: 0.1
+# Version: 0.2
 #
 # Changelog
 # ============================================================
 # [20250507-1] RZ: Implemented signal recorder for full-cycle logging.
+# [20261015-1] agent: Count cycles locally instead of querying sim time every cycle.
 # ============================================================
 
 import cocotb
@@ -31,11 +32,12 @@ async def record_parser_outputs(dut, total_cycles=300):
     _recorded_log = {}
 
     await RisingEdge(dut.clk)
+    # Count cycles locally after one sim-time read
+    abs_cycle = get_sim_time('ns') // SIM_CLK_PERIOD_NS
 
     for _ in range(total_cycles):
         await RisingEdge(dut.clk)
-        sim_time = get_sim_time('ns')
-        abs_cycle = sim_time // SIM_CLK_PERIOD_NS
+        abs_cycle += 1
 
         row = {
         "cycle": abs_cycle,
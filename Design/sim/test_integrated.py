@@ -26,7 +26,7 @@ from cocotb.triggers import RisingEdge
 from cocotb.utils import get_sim_time
 
 from helpers.reset_helper import reset_dut
-from helpers.recorder import record_all_internal_valids, get_recorded_log
+from helpers.recorder import record_all_internal_valids, get_recorded_log, to_csv
 from helpers.full_workload_helper import run_full_payload_workload
 from helpers.compare_helper import compare_against_expected, generate_expected_events_with_fields, generate_expected_events_from_schedule
 from sim_config import SIM_CLK_PERIOD_NS, MSG_SEQUENCE, SIM_CYCLES, RESET_CYCLES
@@ -72,13 +72,7 @@ async def test_full_permutations(dut):
 
 
     # Write recorded log to CSV
-    with open("recorded_log.csv", "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=SIM_HEADERS)
-        writer.writeheader()
-        for cycle in sorted(recorded_log):
-            row = {"cycle": cycle}
-            row.update(recorded_log[cycle])
-            writer.writerow(row)
+    to_csv("recorded_log.csv")
 
     # Write expected events to CSV
     with open("expected_events.csv", "w", newline="") as f: